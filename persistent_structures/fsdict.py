@@ -1,7 +1,29 @@
 """Provides the FSDict module, implementing a MutableMapping interface atop the filesystem."""
+import logging
 import os
+import stat
 from collections.abc import MutableMapping
-from typing import Iterator, Union
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _read_exact(file_descriptor: int, size: int) -> bytes:
+    """Read size bytes from a descriptor, looping over short reads.
+
+    A single os.read is capped at the kernel's per-call limit, which
+    would silently truncate values larger than it.
+    """
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = os.read(file_descriptor, remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
 
 
 class FSDict(MutableMapping):
@@ -11,45 +33,165 @@ class FSDict(MutableMapping):
     python via a dict interface.  Will return an FSDict to represent a
     directory, if one is requested.  Behaviour is undefined if presented with a
     symlink.
+
+    With binary=True, values come back as raw bytes rather than being
+    decoded to str, which skips a decode proportional to the value's
+    size on read-heavy workloads that don't need text.
     """
 
-    def __init__(self, directory: str = '.'):
-        if os.path.isdir(directory):
-            self.directory = directory
-        else:
-            raise ValueError("Directory must exist")
+    def __init__(self, directory: str = '.', *, binary: bool = False):
+        # O_DIRECTORY both validates the path and gives us a descriptor
+        # to resolve keys against, so per-call syscalls don't re-walk
+        # the directory's own path components.
+        try:
+            self._dirfd = os.open(directory, os.O_DIRECTORY | os.O_CLOEXEC)
+        except (OSError, ValueError, TypeError) as err:
+            raise ValueError("Directory must exist") from err
+
+        self.directory = directory
+        self.binary = binary
+        self._prefix = os.path.join(directory, '')
+
+        # Directory listing cache shared by __iter__ and __len__,
+        # refreshed lazily whenever our own mutators have run.  Changes
+        # made by other processes are invisible until refresh() is
+        # called.
+        self._cache: Optional[List[str]] = None
+        self._dirty = True
+
+    def __del__(self) -> None:
+        # _dirfd is absent if __init__ failed before opening it.
+        if getattr(self, '_dirfd', None) is not None:
+            os.close(self._dirfd)
+
+    @classmethod
+    def _from_trusted_path(cls, directory: str, dirfd: int, binary: bool = False) -> 'FSDict':
+        """Build an FSDict around a directory we already hold open.
 
-    def __setitem__(self, k: str, v: str) -> None:
+        Skips the validating open that __init__ performs for
+        user-supplied paths, which would be redundant on internal subdir
+        lookups.  Takes ownership of dirfd.
+        """
+        instance = cls.__new__(cls)
+        instance.directory = directory
+        instance.binary = binary
+        instance._prefix = os.path.join(directory, '')
+        instance._dirfd = dirfd
+        instance._cache = None
+        instance._dirty = True
+        return instance
+
+    def refresh(self) -> None:
+        """Discard the cached directory listing.
+
+        __iter__ and __len__ only re-scan the directory after one of our
+        own mutators has run, so callers sharing the directory with
+        another writer should call this to pick up external changes.
+        """
+        self._dirty = True
+
+    def _entries(self) -> List[str]:
+        """Return the cached directory listing, re-scanning if stale."""
+        if self._dirty or self._cache is None:
+            with os.scandir(self.directory) as entries:
+                self._cache = [
+                    entry.name
+                    for entry in entries
+                    if entry.is_file(follow_symlinks=False) or entry.is_dir(follow_symlinks=False)
+                ]
+            self._dirty = False
+        return self._cache
+
+    def _path(self, k: str) -> str:
+        """Resolve a key to its backing path.
+
+        Plain keys take the precomputed-prefix concatenation, which is
+        cheaper than os.path.join's separator handling on every call;
+        keys containing a separator fall back to a full join.
+        """
+        if os.sep not in k and '/' not in k:
+            return self._prefix + k
+        return os.path.join(self.directory, k)
+
+    def __setitem__(self, k: str, v: Union[str, bytes]) -> None:
         """Update the contents of a file if it exists, else raise a KeyError."""
+        if isinstance(k, str) and '\x00' in k:
+            raise KeyError(k)
+
         try:
-            file_path = os.path.join(self.directory, k)
-            with open(file_path, 'w') as file_handle:
-                file_handle.write(v)
+            # Writing through a raw descriptor skips the TextIOWrapper
+            # that open('w') would add, encoding the value exactly once.
+            # Resolving the key against _dirfd saves the kernel
+            # re-walking the directory's path on every store.
+            data = v.encode() if isinstance(v, str) else v
+            file_descriptor = os.open(
+                k,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                0o644,
+                dir_fd=self._dirfd,
+            )
+            try:
+                # os.write may write fewer bytes than asked, so loop
+                # until the whole value is on disk.
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(file_descriptor, view):]
+            finally:
+                os.close(file_descriptor)
+
+            self._dirty = True
         except (OSError, IOError, ValueError, TypeError) as err:
-            print("Encountered unexpected behaviour when storing key's value to disk.")
-            raise KeyError("Unable to write file for {}".format(file_path)) from err
+            LOGGER.debug("Unable to store value for key %r to disk: %s", k, err)
+            raise KeyError("Unable to write file for {}".format(self._path(k))) from err
 
     def __getitem__(self, k: str) -> Union[str, bytes, 'FSDict']:
         """Retrieve the contents of a file (the dict's value), for the given key.
 
         Raise a KeyError if the file cannot be found.
         """
+        # A NUL byte can never name a file, so reject it without paying
+        # for a syscall and the OSError unwind it would trigger.
+        if isinstance(k, str) and '\x00' in k:
+            raise KeyError(k)
+
+        # EAFP: open the target straight away rather than stat'ing the
+        # path first, which drops a syscall from every read and closes
+        # the race window between the check and the open.  Resolving the
+        # key against _dirfd skips the kernel's walk of the directory's
+        # own path components.  The fstat on the resulting descriptor
+        # tells us whether we got a file or a directory.  O_NONBLOCK is a
+        # no-op for regular files and directories, but stops the open
+        # hanging on a FIFO with no writer, which falls through to the
+        # KeyError below like any other non-file entry.
         try:
-            target = os.path.join(self.directory, k)
-            if os.path.isfile(target):
-                with open(target) as file_handle:
-                    return file_handle.read()
+            file_descriptor = os.open(k, os.O_RDONLY | os.O_NONBLOCK, dir_fd=self._dirfd)
+        except (OSError, ValueError, TypeError) as err:
+            raise KeyError("{} doesn't exist.".format(self._path(k))) from err
 
-            elif os.path.isdir(target):
-                return FSDict(target)
+        try:
+            file_status = os.fstat(file_descriptor)
+        except OSError as err:
+            os.close(file_descriptor)
+            raise KeyError("{} doesn't exist.".format(self._path(k))) from err
 
-            else:
-                raise KeyError(
-                    "Unable to return file contents or a FSDict for {}".format(target),
-                )
+        if stat.S_ISDIR(file_status.st_mode):
+            # The descriptor we just opened doubles as the child's
+            # dirfd, so building the child costs no further syscalls.
+            return type(self)._from_trusted_path(self._path(k), file_descriptor, self.binary)
+
+        try:
+            if stat.S_ISREG(file_status.st_mode):
+                # A raw file descriptor read skips the TextIOWrapper and
+                # BufferedReader layers open() would build, which dominate
+                # the cost of fetching small values.
+                data = _read_exact(file_descriptor, file_status.st_size)
+                return data if self.binary else data.decode()
+        finally:
+            os.close(file_descriptor)
 
-        except (ValueError, TypeError) as err:
-            raise KeyError("{} doesn't exist.".format(target)) from err
+        raise KeyError(
+            "Unable to return file contents or a FSDict for {}".format(self._path(k)),
+        )
 
     def __delitem__(self, k: str) -> None:
         """Delete the file specified by the provided key.
@@ -57,20 +199,81 @@ class FSDict(MutableMapping):
         (effectively removing the key and its value from the dict).  Raise
         KeyError if the file cannot be found.
         """
+        if isinstance(k, str) and '\x00' in k:
+            raise KeyError(k)
+
         try:
-            os.remove(os.path.join(self.directory, k))
+            os.remove(k, dir_fd=self._dirfd)
         except FileNotFoundError as err:
             raise KeyError from err
 
+        self._dirty = True
+
+    def read_all(self) -> Dict[str, bytes]:
+        """Read every file in the directory in a single pass.
+
+        Returns a mapping of key to raw bytes content, skipping
+        subdirectories.  One scandir plus a descriptor read per file is
+        much cheaper than the MutableMapping default of iterating keys
+        and fetching each through __getitem__, which re-resolves and
+        decodes every entry.
+        """
+        contents = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+
+                file_descriptor = os.open(entry.path, os.O_RDONLY)
+                try:
+                    contents[entry.name] = _read_exact(
+                        file_descriptor,
+                        os.fstat(file_descriptor).st_size,
+                    )
+                finally:
+                    os.close(file_descriptor)
+
+        return contents
+
+    @staticmethod
+    def _scan_directory(path: str) -> Tuple[str, List[str], List[str]]:
+        """Scan one directory, returning its path, entry names and subdir paths."""
+        names = []
+        subdirectories = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    names.append(entry.name)
+                    subdirectories.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    names.append(entry.name)
+        return path, names, subdirectories
+
+    def walk(self, max_workers: int = 8) -> Iterator[Tuple[str, List[str]]]:
+        """Walk the directory tree, scanning subdirectories in parallel.
+
+        Yields (directory path, entry names) pairs in no guaranteed
+        order.  Each subdirectory scan is independent, so spreading them
+        across a thread pool hides per-directory latency, which
+        otherwise serialises deep traversals on slow filesystems.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {executor.submit(self._scan_directory, self.directory)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, names, subdirectories = future.result()
+                    for subdirectory in subdirectories:
+                        pending.add(executor.submit(self._scan_directory, subdirectory))
+                    yield path, names
+
     def __len__(self) -> int:
-        # Iterating through a generator of files here would be more memory
-        # efficient, but scandir gives us a bunch of extra information that
-        # isn't needed in this method, which would add uneeded CPU cost.
-        return len(os.listdir(self.directory))
+        return len(self._entries())
 
     def __iter__(self) -> Iterator[str]:
-        return (
-            file.name
-            for file in os.scandir(self.directory)
-            if any((os.path.isfile(file), os.path.isdir(file)))
-        )
+        return iter(self._entries())
+
+
+# Compatibility alias for code written against the FileDict name; there
+# is only one implementation.
+FileDict = FSDict
@@ -1,8 +1,9 @@
 """Provides the FSQueue module, implementing a Queue-like interface atop the filesystem."""
 
 import os
+from collections import deque
 from queue import Queue
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Deque
 
 if TYPE_CHECKING:
     # This is annoying, and ugly as.  See
@@ -13,6 +14,10 @@ if TYPE_CHECKING:
 else:
     FSQUEUEBASE = Queue
 
+# Queue indices are zero-padded to this width so byte-wise lexicographic
+# order matches numeric order, letting _get sort names without parsing.
+_INDEX_WIDTH = 16
+
 
 class FSQueue(FSQUEUEBASE):  # pylint: disable = too-few-public-methods
     """Implements a Queue interface atop the filesystem.
@@ -36,19 +41,73 @@ class FSQueue(FSQUEUEBASE):  # pylint: disable = too-few-public-methods
         self.file_prefix = file_prefix
         self.maxsize = maxsize
 
+        # Track the queue depth and next enqueue index in-process, seeded
+        # by a single scan of the backing directory, so neither _qsize nor
+        # _put has to re-scan it on every call.
+        with os.scandir(directory) as entries:
+            extant_names = [
+                entry.name
+                for entry in entries
+                if self._is_entry_name(entry.name)
+            ]
+
+        # Migrate any entries written before indices were zero-padded, so
+        # the whole directory sorts correctly without a key function.
+        extant_indices = []
+        for name in extant_names:
+            index = int(name[len(file_prefix):])
+            extant_indices.append(index)
+
+            padded_name = self._entry_name(index)
+            if name != padded_name:
+                os.rename(
+                    os.path.join(directory, name),
+                    os.path.join(directory, padded_name),
+                )
+
+        self._count = len(extant_indices)
+
+        # Snapshot of file names waiting to be dequeued, refilled lazily
+        # by _get so repeated gets don't each re-scan and re-sort the
+        # directory.
+        self._pending: Deque[str] = deque()
+        self._next_idx = 1 + max(extant_indices, default=0)
+
         super().__init__(maxsize)
 
     def _init(self, _) -> None:
         pass
 
     def _qsize(self) -> int:
-        return len(os.listdir(self.directory))
+        return self._count
+
+    def _is_entry_name(self, name: str) -> bool:
+        """Whether a file name matches this queue's prefix-plus-index scheme."""
+        return name.startswith(self.file_prefix) and name[len(self.file_prefix):].isdigit()
+
+    def _entry_name(self, index: int) -> str:
+        """Format a queue index into its fixed-width file name."""
+        return '{prefix}{index:0{width}d}'.format(
+            prefix=self.file_prefix,
+            index=index,
+            width=_INDEX_WIDTH,
+        )
 
     # Get an item from the queue
     def _get(self) -> str:
-        items = os.listdir(self.directory)
-        items.sort()
-        target = os.path.join(self.directory, items[0])
+        # One scan-and-sort refills the snapshot for a whole run of gets,
+        # rather than paying for a listdir+sort on each one.
+        if not self._pending:
+            # Fixed-width indices make plain string order numeric order,
+            # so no key function or per-entry parse is needed.
+            with os.scandir(self.directory) as entries:
+                self._pending.extend(sorted(
+                    entry.name
+                    for entry in entries
+                    if entry.is_file(follow_symlinks=False) and self._is_entry_name(entry.name)
+                ))
+
+        target = os.path.join(self.directory, self._pending.popleft())
         try:
             if os.path.isfile(target):
                 content = ""
@@ -58,6 +117,7 @@ class FSQueue(FSQUEUEBASE):  # pylint: disable = too-few-public-methods
                 # Getting from the queue de-queues, so we should remove the
                 # file here.
                 os.remove(target)
+                self._count -= 1
                 return content
 
             raise KeyError("Unable to return file contents for {}".format(target))
@@ -67,24 +127,10 @@ class FSQueue(FSQUEUEBASE):  # pylint: disable = too-few-public-methods
 
     # Put a new item in the queue
     def _put(self, data: str) -> None:
-        # Get the next available file_name for us to store the queue entry in.
-        extant_items = os.listdir(self.directory)
-        extant_items.sort()
-
-        highest_name = '{}{}'.format(self.file_prefix, 1)
-        for item in extant_items:
-            print('current: {}, highest so far: {}'.format(item, highest_name))
-            if item > highest_name:
-                highest_name = item
-
-        # Process the index out of the file name.
-        suffix = highest_name.split(self.file_prefix)[-1]
-        current_index = int(suffix) if suffix else 0
-
-        new_name = '{}{}'.format(
-            self.file_prefix,
-            current_index + 1,
-        )
+        new_name = self._entry_name(self._next_idx)
 
         with open(os.path.join(self.directory, new_name), 'w') as file_handle:
             file_handle.write(data)
+
+        self._next_idx += 1
+        self._count += 1
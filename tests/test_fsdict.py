@@ -1,6 +1,7 @@
 """Tests to cover the fsdict class."""
 
 import os
+from pathlib import Path
 from random import randint
 
 import pytest
@@ -48,6 +49,53 @@ def test_iter() -> None:
     assert os.listdir(os.path.curdir) == [filename for filename in test_fsd]
 
 
+def test_iter_cache_and_refresh(tmp_path: Path) -> None:
+    """Verify iteration reflects our own writes, and refresh picks up external ones."""
+    test_fsd = FSDict(str(tmp_path))
+
+    test_fsd['sample'] = 'sample text'
+    assert list(test_fsd) == ['sample']
+
+    # Files created behind the FSDict's back only appear after refresh().
+    with open(str(tmp_path / 'external'), 'w') as test_file_handle:
+        test_file_handle.write('external text')
+
+    assert list(test_fsd) == ['sample']
+    test_fsd.refresh()
+    assert sorted(test_fsd) == ['external', 'sample']
+
+
+def test_read_all(tmp_path: Path) -> None:
+    """Verify read_all returns every file's raw content, skipping subdirectories."""
+    test_fsd = FSDict(str(tmp_path))
+    test_fsd['first'] = 'first value'
+    test_fsd['second'] = 'second value'
+    os.mkdir(str(tmp_path / 'subdir'))
+
+    assert test_fsd.read_all() == {
+        'first': b'first value',
+        'second': b'second value',
+    }
+
+
+def test_walk(tmp_path: Path) -> None:
+    """Verify walk visits every directory in the tree, in any order."""
+    test_fsd = FSDict(str(tmp_path))
+    test_fsd['top'] = 'top value'
+    os.makedirs(str(tmp_path / 'subdir' / 'nested'))
+
+    with open(str(tmp_path / 'subdir' / 'inner'), 'w') as test_file_handle:
+        test_file_handle.write('inner value')
+
+    walked = {path: sorted(names) for path, names in test_fsd.walk()}
+
+    assert walked == {
+        str(tmp_path): ['subdir', 'top'],
+        str(tmp_path / 'subdir'): ['inner', 'nested'],
+        str(tmp_path / 'subdir' / 'nested'): [],
+    }
+
+
 def test_setitem() -> None:
     """Verify adding a key to FSDict creates a file with the appropriate value."""
     temp_file_path = 'test_setitem{}'.format(randint(0, 20))
@@ -99,6 +147,19 @@ def test_getitem() -> None:
     os.remove(temp_file_path)
 
 
+def test_getitem_binary(tmp_path: Path) -> None:
+    """Verify binary mode returns raw bytes, and nested FSDicts inherit it."""
+    test_fsd = FSDict(str(tmp_path), binary=True)
+    test_fsd['sample'] = b'\x00\x01raw bytes'
+    os.mkdir(str(tmp_path / 'subdir'))
+
+    assert test_fsd['sample'] == b'\x00\x01raw bytes'
+
+    subdir_fsd = test_fsd['subdir']
+    assert isinstance(subdir_fsd, FSDict)
+    assert subdir_fsd.binary is True
+
+
 def test_getitem_no_file() -> None:
     """Verify we get a KeyError when requesting a file that doesn't exist."""
     temp_file_path = os.path.join(
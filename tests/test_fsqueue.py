@@ -0,0 +1,74 @@
+"""Tests to cover the fsqueue class."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from persistent_structures.fsqueue import FSQueue
+
+
+def test_put_creates_file(tmp_path: Path) -> None:
+    """Verify putting to the queue creates a file holding the value."""
+    test_fsq = FSQueue(str(tmp_path))
+
+    test_fsq.put('sample text')
+
+    expected_name = 'FSList-{:016d}'.format(1)
+    assert os.listdir(str(tmp_path)) == [expected_name]
+    with open(str(tmp_path / expected_name)) as test_file_handle:
+        assert test_file_handle.read() == 'sample text'
+
+
+def test_put_resumes_after_existing_entries(tmp_path: Path) -> None:
+    """Verify new entries are indexed after any already on disk."""
+    with open(str(tmp_path / 'FSList-3'), 'w') as test_file_handle:
+        test_file_handle.write('existing entry')
+
+    test_fsq = FSQueue(str(tmp_path))
+    test_fsq.put('new entry')
+
+    assert sorted(os.listdir(str(tmp_path))) == [
+        'FSList-{:016d}'.format(3),
+        'FSList-{:016d}'.format(4),
+    ]
+
+
+def test_unpadded_entries_migrate_and_dequeue_in_order(tmp_path: Path) -> None:
+    """Verify entries from the old unpadded naming scheme dequeue correctly."""
+    for index in (2, 10):
+        with open(str(tmp_path / 'FSList-{}'.format(index)), 'w') as test_file_handle:
+            test_file_handle.write('entry {}'.format(index))
+
+    test_fsq = FSQueue(str(tmp_path))
+
+    assert test_fsq.get() == 'entry 2'
+    assert test_fsq.get() == 'entry 10'
+
+
+def test_fifo_order_past_ten_entries(tmp_path: Path) -> None:
+    """Verify entries dequeue in put order once indices reach double digits."""
+    test_fsq = FSQueue(str(tmp_path))
+
+    for value in range(12):
+        test_fsq.put(str(value))
+
+    assert [test_fsq.get() for _ in range(12)] == [str(value) for value in range(12)]
+
+
+def test_qsize(tmp_path: Path) -> None:
+    """Verify qsize tracks puts and gets."""
+    test_fsq = FSQueue(str(tmp_path))
+    assert test_fsq.qsize() == 0
+
+    test_fsq.put('sample text')
+    assert test_fsq.qsize() == 1
+
+    test_fsq.get()
+    assert test_fsq.qsize() == 0
+
+
+def test_ephemeral_initial_directory() -> None:
+    """Verify we get a ValueError when instantiating FSQueue with a non-extant directory."""
+    with pytest.raises(ValueError):
+        FSQueue('no_such_directory_here')